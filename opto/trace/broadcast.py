@@ -4,6 +4,19 @@ from opto.trace.containers import NodeContainer
 from opto.trace.nodes import Node
 
 
+class _PendingBuild:
+    """Stack marker used by recursive_conversion to rebuild a container once
+    its converted elements are available."""
+
+    __slots__ = ("cls", "n", "keys", "template")
+
+    def __init__(self, cls, n, keys=None, template=None):
+        self.cls = cls
+        self.n = n
+        self.keys = keys
+        self.template = template
+
+
 def recursive_conversion(true_func, false_func):
     """Recursively apply true_func to the nodes and false_func to the rest of
     the objects in a container of nodes. Container of nodes are tuple, list,
@@ -15,24 +28,100 @@ def recursive_conversion(true_func, false_func):
 
     """
 
+    # NOTE The traversal is deliberately pure Python. A compiled (Cython/C)
+    # walker was considered but rejected: this package ships as pure-Python
+    # and the dispatch below already keeps the per-element cost to a dict
+    # lookup for the common types.
     def func(obj):
-        if isinstance(obj, Node):  # base case
-            return true_func(obj)
-        elif isinstance(obj, tuple):
-            return tuple(func(x) for x in obj)
-        elif isinstance(obj, list):
-            return [func(x) for x in obj]
-        elif isinstance(obj, dict):
-            return {k: func(v) for k, v in obj.items()}
-        elif isinstance(obj, set):
-            return {func(x) for x in obj}
-        elif isinstance(obj, NodeContainer):
-            output = copy.copy(obj)
-            for k, v in obj.__dict__.items():
-                setattr(output, k, func(v))
-            return output
-        else:
-            return false_func(obj)
+        # Iterative post-order walk with an explicit stack: each container
+        # pushes a _PendingBuild marker followed by its elements, and popping
+        # the marker assembles the converted elements from the results list.
+        # This removes a Python function call per element and cannot hit the
+        # recursion limit on deeply nested inputs. Leaves dispatch on the
+        # exact type first; dispatch_get is bound to a local to skip the
+        # attribute lookup per element.
+        stack = [obj]
+        results = []
+        while stack:
+            x = stack.pop()
+            tx = type(x)
+            if tx is _PendingBuild:
+                n = x.n
+                if n:
+                    items = results[-n:]
+                    del results[-n:]
+                else:
+                    items = []
+                cls = x.cls
+                if cls is list:
+                    results.append(items)
+                elif cls is tuple:
+                    results.append(tuple(items))
+                elif cls is dict:
+                    results.append(dict(zip(x.keys, items)))
+                elif cls is set:
+                    results.append(set(items))
+                else:  # NodeContainer
+                    output = x.template
+                    for k, v in zip(x.keys, items):
+                        setattr(output, k, v)
+                    results.append(output)
+                continue
+            fn = dispatch_get(tx)
+            if fn is None:
+                # Fall back to isinstance checks, which also handle
+                # subclasses (converted to their base container type, as
+                # the recursive comprehensions did before).
+                if isinstance(x, Node):
+                    fn = true_func
+                elif isinstance(x, (tuple, list)):
+                    tx = tuple if isinstance(x, tuple) else list
+                elif isinstance(x, dict):
+                    tx = dict
+                elif isinstance(x, set):
+                    tx = set
+                elif isinstance(x, NodeContainer):
+                    tx = NodeContainer
+                else:
+                    fn = false_func
+            if fn is not None:
+                results.append(fn(x))
+            elif tx is tuple or tx is list:
+                stack.append(_PendingBuild(tx, len(x)))
+                stack.extend(reversed(x))
+            elif tx is dict:
+                stack.append(_PendingBuild(dict, len(x), keys=list(x)))
+                values = list(x.values())
+                values.reverse()
+                stack.extend(values)
+            elif tx is set:
+                stack.append(_PendingBuild(set, len(x)))
+                stack.extend(x)
+            else:  # NodeContainer
+                d = x.__dict__
+                keys = list(d)
+                stack.append(
+                    _PendingBuild(
+                        NodeContainer, len(keys), keys=keys, template=copy.copy(x)
+                    )
+                )
+                values = list(d.values())
+                values.reverse()
+                stack.extend(values)
+        return results[0]
+
+    # Exact-type dispatch for the leaves; containers are classified above.
+    dispatch = {
+        Node: true_func,
+        # Primitive leaves skip the ladder entirely.
+        int: false_func,
+        float: false_func,
+        str: false_func,
+        bytes: false_func,
+        bool: false_func,
+        type(None): false_func,
+    }
+    dispatch_get = dispatch.get
 
     return func
 
@@ -1,3 +1,4 @@
+import contextlib
 import copy
 import ctypes
 import functools
@@ -5,11 +6,11 @@ import inspect
 import re
 import sys
 import traceback
-import asyncio
 
 from typing import List, Dict, Callable, Union, Any
 
 from opto.trace.broadcast import recursive_conversion
+from opto.trace.containers import NodeContainer
 from opto.trace.errors import ExecutionError, TraceMissingInputsError
 from opto.trace.modules import Module
 from opto.trace.nodes import GRAPH
@@ -22,7 +23,93 @@ from opto.trace.nodes import (
     node,
     get_op_name,
 )
-from opto.trace.utils import contain
+
+# Precompiled regexes used on hot paths. re caches compiled patterns
+# internally, but each re.search call still pays a cache lookup and argument
+# parsing; compiling once at import time avoids that.
+_DEF_DOCSTRING_RE = re.compile(r"\s*(def.*\"\"\")", re.DOTALL)
+_DEF_SIGNATURE_RE = re.compile(r"\s*(def.*:)")
+_DEF_NAME_RE = re.compile(r"\s*def\s+(\w+)")
+# Matches a decorator line applying bundle, e.g. "@bundle(", "@bundle\",
+# "@trace.bundle(", or "@....bundle\".
+_BUNDLE_DECORATOR_RE = re.compile(r"@(?:.*\.)?bundle[\(\\]")
+
+_MISSING = object()  # sentinel for absent dict entries
+
+# (co_filename, co_firstlineno) -> (source, line_number). get_source runs on
+# every frame when error comments are built, and its scan is deterministic
+# per code object; see FunModule.get_source.
+_SOURCE_CACHE = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _introspect_fun(fun):
+    """Cache the results of introspecting a function.
+
+    inspect.getsource and inspect.getfile re-read and re-parse the source file
+    on every call, which is pure overhead when the same function is bundled
+    repeatedly (e.g., inside a loop). The results are immutable per function
+    object, so we cache them keyed on the function itself (the cache holds a
+    strong reference, which also prevents id reuse).
+
+    Returns:
+        tuple: (source, line_number, file) of the function.
+    """
+    source, line_number = FunModule.get_source(fun)
+    return source, line_number, inspect.getfile(fun)
+
+
+@functools.lru_cache(maxsize=None)
+def _getdoc_fun(fun):
+    """Cached cleaned docstring of a function."""
+    docstring = inspect.getdoc(fun)
+    return inspect.cleandoc(docstring) if docstring is not None else ""
+
+
+@functools.lru_cache(maxsize=None)
+def _getsignature_fun(fun):
+    """Cached Signature of a function."""
+    return inspect.signature(fun)
+
+
+class FunInfo(dict):
+    """The info dict of a FunModule.
+
+    The 'doc' and 'signature' entries are rarely read at run time (mainly
+    during error reporting and graph inspection), so they are materialized on
+    first access instead of at decoration time. copy() fills them in, since
+    MessageNode keeps a plain-dict snapshot of the info.
+    """
+
+    def __init__(self, fun, fields):
+        super().__init__(fields)
+        self._fun = fun
+
+    def __missing__(self, key):
+        if key == "doc":
+            value = _getdoc_fun(self._fun)
+        elif key == "signature":
+            value = _getsignature_fun(self._fun)
+        else:
+            raise KeyError(key)
+        self[key] = value
+        return value
+
+    def copy(self):
+        # Each MessageNode keeps its own snapshot because the run-time
+        # entries ('output', 'inputs', 'external_dependencies', 'traceback',
+        # 'error_comment') are rewritten on every call; sharing one dict
+        # across nodes would let later calls overwrite earlier records. The
+        # static entries are shared by reference, so this stays a single
+        # shallow dict copy per call.
+        # Materialize the lazy entries once, each on its own: 'doc' may have
+        # been filled in already (e.g. by the auto-generated description in
+        # __init__) while 'signature' has not.
+        if "doc" not in self:
+            self["doc"] = _getdoc_fun(self._fun)
+        if "signature" not in self:
+            self["signature"] = _getsignature_fun(self._fun)
+        return dict(self)
 
 
 def bundle(
@@ -51,7 +138,9 @@ def bundle(
     Returns:
         FunModule: The wrapped function that returns node objects.
     """
-    prev_f_locals = inspect.stack()[1].frame.f_locals
+    # sys._getframe avoids inspect.stack(), which builds FrameInfo records
+    # (with source lookups) for the entire call stack just to reach f_locals.
+    prev_f_locals = sys._getframe(1).f_locals
 
     def decorator(fun):
         fun_module = FunModule(
@@ -74,12 +163,27 @@ class trace_nodes:
     """This is a context manager for keeping track which nodes are read/used in an operator."""
 
     def __enter__(self):
-        nodes = set()
+        if not GRAPH.TRACE:
+            # Node.data only records reads when GRAPH.TRACE is on, so there
+            # is nothing to collect; skip the stack bookkeeping entirely.
+            # Remember the decision, since TRACE may flip before __exit__.
+            self._pushed = False
+            return []
+        self._pushed = True
+        nodes = []
         USED_NODES.append(nodes)
         return nodes
 
     def __exit__(self, type, value, traceback):
-        USED_NODES.pop()
+        if not self._pushed:
+            return
+        nodes = USED_NODES.pop()
+        # A node is appended once per read; dedupe by identity here (in
+        # first-read order) so each read only pays a list append instead of a
+        # set insertion. The caller keeps the same list object.
+        unique = {id(n): n for n in nodes}
+        if len(unique) != len(nodes):
+            nodes[:] = unique.values()
 
 
 class FunModule(Module):
@@ -118,20 +222,19 @@ class FunModule(Module):
 
         assert callable(fun), "fun must be a callable."
 
-        # Get the source code of the function, excluding the decorator line
-        source, line_number = self.get_source(fun)
+        # Get the cached introspection results of the function. The source
+        # excludes the decorator line.
+        source, line_number, file = _introspect_fun(fun)
 
-        # Construct the info dictionary
-        docstring = inspect.getdoc(fun)
-        self.info = dict(  # TODO explain the info dict
+        # Construct the info dictionary. 'doc' and 'signature' are computed
+        # lazily by FunInfo on first access.
+        self.info = FunInfo(fun, dict(  # TODO explain the info dict
             # info about the decorated function
             fun=None,  # to be defined at run time
             fun_name=fun.__qualname__,
-            doc=inspect.cleandoc(docstring) if docstring is not None else "",
-            signature=inspect.signature(fun),
             source=source,
             line_number=line_number,
-            file=inspect.getfile(fun),
+            file=file,
             error_comment=None,
             traceback=None,
             # for traceable_code == True
@@ -139,12 +242,17 @@ class FunModule(Module):
             inputs={"args": [], "kwargs": {}},  # inputs of the function
             # misc
             external_dependencies=None,
-        )
+        ))
 
         if description is None:
             # Generate the description from the function name and docstring.
             description = f"[{self.info['fun_name']}] {self.info['doc']}."
-        assert len(get_op_name(description)) > 0
+        # The description is shared by every MessageNode this operator
+        # creates, so intern it and parse the operator name out of it once,
+        # rather than on every access of the name property.
+        description = sys.intern(description)
+        self._name = sys.intern(get_op_name(description))
+        assert len(self._name) > 0
 
         self.traceable_code = traceable_code
         self._fun = fun
@@ -154,16 +262,46 @@ class FunModule(Module):
         self.allow_external_dependencies = allow_external_dependencies
         self.parameter = None
         self.overwrite_python_recursion = overwrite_python_recursion
+        self._compiled_cache = {}  # code str -> compiled code object
+        self._fun_cache = (None, None)  # (code str, exec'd function)
+        self._exec_globals = None  # merged globals for exec'd code, built lazily
+        self._runtime_fun = None  # see _introspect_runtime_fun
+        # A function can only call itself if its own name is resolvable from
+        # inside its body (as a global, a closure cell, or a local). When it is
+        # not, there is no recursion to overwrite. We record how the name is
+        # resolved, since the global case can be intercepted much more cheaply
+        # than the shadowed cases, which need a tracer.
+        code = fun.__code__
+        if fun.__name__ in code.co_freevars:
+            self._recursion_scope = "closure"
+            # Index of the closure cell holding the recursive name. The cell
+            # is looked up through self._fun at call time, since cells do not
+            # survive deepcopy with their identity intact.
+            self._closure_index = code.co_freevars.index(fun.__name__)
+        elif (
+            fun.__name__ in code.co_varnames or fun.__name__ in code.co_cellvars
+        ):
+            self._recursion_scope = "local"
+        elif fun.__name__ in code.co_names:
+            self._recursion_scope = "global"
+        else:
+            self._recursion_scope = None
+        self._can_recurse = self._recursion_scope is not None
+        # The argspec of the decorated function is fixed, so compute it once.
+        # Trainable code defines a new function at run time, whose argspec is
+        # resolved in _get_fullargspec instead.
+        self._fullargspec = inspect.getfullargspec(fun)
+        self._is_async = inspect.iscoroutinefunction(fun)
         if trainable:
             # trainable code uses exec which has an effect of overwrite_python_recursion==True.
             self.overwrite_python_recursion = True
             # assert overwrite_python_recursion, "trainable requires overwrite_python_recursion to be True."
 
-            signature_sr = re.search(r"\s*(def.*\"\"\")", source, re.DOTALL)
+            signature_sr = _DEF_DOCSTRING_RE.search(source)
             if (
                 signature_sr is None
             ):  # if there is no docstring just take the first line
-                signature = re.search(r"\s*(def.*:)", source).group(1)
+                signature = _DEF_SIGNATURE_RE.search(source).group(1)
             else:
                 signature = signature_sr.group(1)
             self.parameter = ParameterNode(
@@ -171,6 +309,15 @@ class FunModule(Module):
                 name="__code",
                 constraint="The code should start with:\n" + signature,
             )
+            # The output of a trainable op is always wrapped as an eval
+            # operator; fix its description and name here rather than
+            # re-deriving them on every wrap call.
+            self._wrap_description = "[eval] This operator eval(__code, *args, **kwargs) evaluates the code block, where __code is the code (str) and *args and **kwargs are the arguments of the function. The output is the result of the evaluation, i.e., __code(*args, **kwargs)."
+            self._wrap_name = "eval"
+            self.info["fun_name"] = "eval"
+        else:
+            self._wrap_description = self.description
+            self._wrap_name = self._name
 
     @property
     def trainable(self):
@@ -187,13 +334,33 @@ class FunModule(Module):
             code = (
                 self.parameter._data
             )  # This is not traced, but we will add this as the parent later.
+            # The optimizer calls the op many times between parameter
+            # updates; reuse the exec'd function while the code is unchanged.
+            cached_code, cached_fun = self._fun_cache
+            if code is cached_code or code == cached_code:
+                return cached_fun
             # before we execute,  we should try to import all the global name spaces from the original function
             try:
                 _ldict = {}
-                gdict = self._fun.__globals__.copy()
-                gdict.update(self._ldict)
-                exec(code, gdict, _ldict)  # define the function
-                fun_name = re.search(r"\s*def\s+(\w+)", code).group(1)
+                # Merge the decorated function's globals with the locals
+                # captured at decoration time once per FunModule, not per
+                # exec. Later definitions accumulate in the shared dict,
+                # which the recursive-call binding below relies on.
+                gdict = self._exec_globals
+                if gdict is None:
+                    gdict = self._fun.__globals__.copy()
+                    gdict.update(self._ldict)
+                    self._exec_globals = gdict
+                # Compile once per code string; the optimizer typically calls
+                # the same parameter many times between updates.
+                compiled = self._compiled_cache.get(code)
+                if compiled is None:
+                    compiled = compile(
+                        code, f"<bundle:{self.info['fun_name']}>", "exec"
+                    )
+                    self._compiled_cache[code] = compiled
+                exec(compiled, gdict, _ldict)  # define the function
+                fun_name = _DEF_NAME_RE.search(code).group(1)
                 fun = _ldict[fun_name]
                 fun.__globals__[fun_name] = fun  # for recursive calls
             except SyntaxError as err:
@@ -209,6 +376,7 @@ class FunModule(Module):
                 line_number = traceback.extract_tb(tb)[-1][1]
                 e = err
             else:
+                self._fun_cache = (code, fun)
                 return fun
 
             base_message = f"({error_class}) {detail}."
@@ -229,14 +397,43 @@ class FunModule(Module):
                 inputs={"code": self.parameter},
                 description=f"[exception] The code parameter {self.parameter.py_name} has an error.",
                 name="exception_" + self.parameter.py_name,
-                info=self.info,
+                # Pass the materialized snapshot, as wrap() does:
+                # ExceptionNode.create_feedback expects a plain dict.
+                info=self.info.copy(),
             )
 
             raise ExecutionError(e_node)
 
     @property
     def name(self):
-        return get_op_name(self.description)
+        return self._name
+
+    def _get_fullargspec(self, fun):
+        """Return the (cached) full argspec of the operator fun."""
+        if fun is self._fun:
+            return self._fullargspec
+        if fun is not self._runtime_fun:
+            self._introspect_runtime_fun(fun)
+        return self._runtime_fullargspec
+
+    def _get_signature(self, fun):
+        """Return the (cached) Signature of the operator fun."""
+        if fun is self._fun:
+            return _getsignature_fun(fun)
+        if fun is not self._runtime_fun:
+            self._introspect_runtime_fun(fun)
+        return self._runtime_signature
+
+    def _introspect_runtime_fun(self, fun):
+        """Cache the introspection of the function defined by trainable code.
+
+        The function is a fresh object created by exec, so the module-level
+        per-function caches do not apply; remember the latest one instead,
+        which stays valid until the code parameter changes.
+        """
+        self._runtime_signature = inspect.signature(fun)
+        self._runtime_fullargspec = inspect.getfullargspec(fun)
+        self._runtime_fun = fun
 
     def _wrap_inputs(self, fun, args, kwargs):
         """Wrap the inputs to a function as nodes when they're not.
@@ -256,11 +453,12 @@ class FunModule(Module):
         # Wrap the inputs as nodes
 
         # add default into kwargs
-        ba = inspect.signature(fun).bind(*args, **kwargs)
+        signature = self._get_signature(fun)
+        ba = signature.bind(*args, **kwargs)
         a0 = ba.arguments.copy()
         ba.apply_defaults()
         a1 = ba.arguments
-        fullargspec = inspect.getfullargspec(fun)
+        fullargspec = self._get_fullargspec(fun)
         # include default into the kwargs
         for k, v in a1.items():
             if k not in a0:
@@ -269,38 +467,25 @@ class FunModule(Module):
         # convert args and kwargs to nodes, except for FunModule
         _args, _kwargs = args, kwargs  # back up
 
+        # Values that are already Node (the common case) or FunModule pass
+        # through unchanged, without the checks inside node().
+        argnames = fullargspec.args
         args = [
             (
-                node(
-                    a,
-                    name=(
-                        fullargspec.args[i]
-                        if i < len(fullargspec.args) and not isinstance(a, Node)
-                        else None
-                    ),
-                )
-                if not isinstance(a, FunModule)
-                else a
+                a
+                if isinstance(a, (Node, FunModule))
+                else node(a, name=argnames[i] if i < len(argnames) else None)
             )
             for i, a in enumerate(args)
         ]
         kwargs = {
-            k: (
-                node(v, name=k if not isinstance(v, Node) else None)
-                if not isinstance(v, FunModule)
-                else v
-            )
+            k: (v if isinstance(v, (Node, FunModule)) else node(v, name=k))
             for k, v in kwargs.items()
         }
 
         # Construct the input dict of the MessageNode from function inputs
         inputs = {}
-        # args, varargs, varkw, defaults, kwonlyargs, kwonlydefaults, ann
-        _, varargs, varkw, _, _, _, _ = inspect.getfullargspec(fun)
-
-        # bind the node version of args and kwargs
-        ba = inspect.signature(fun).bind(*args, **kwargs)
-        spec = ba.arguments
+        varargs, varkw = fullargspec.varargs, fullargspec.varkw
 
         def extract_param(n):
             return (
@@ -309,20 +494,27 @@ class FunModule(Module):
                 else n
             )
 
-        # expand varargs and varkw
-        for k, v in spec.items():
+        # a1 already lists the bound parameter names in signature order, so
+        # the input dict can be rebuilt from the wrapped args/kwargs directly
+        # instead of paying for a second signature.bind. A parameter reaches
+        # the final branch only when it was bound positionally, in which case
+        # its iteration index is its position in args (positionally bound
+        # parameters form a prefix of the signature order).
+        for i, k in enumerate(a1):
             if k == varargs:  # unpack varargs
-                for i, n in enumerate(v):
-                    inputs[f"args_{i}"] = extract_param(
+                for j, n in enumerate(args[len(argnames) :]):
+                    inputs[f"args_{j}"] = extract_param(
                         n
                     )  # TODO different representation?
             elif k == varkw:  # unpack varkw
-                for kk, n in v.items():
-                    inputs[kk] = extract_param(n)
+                for kk in a1[k]:
+                    inputs[kk] = extract_param(kwargs[kk])
+            elif k in kwargs:
+                inputs[k] = extract_param(kwargs[k])
             else:
-                inputs[k] = extract_param(v)
+                inputs[k] = extract_param(args[i])
         assert all(
-            [isinstance(n, Node) for n in inputs.values()]
+            isinstance(n, Node) for n in inputs.values()
         ), "All values in inputs must be nodes."
 
         return inputs, args, kwargs, _args, _kwargs
@@ -411,43 +603,80 @@ class FunModule(Module):
         output = e
         return output
 
-    def sync_call_fun(self, fun, *_args, **_kwargs):
-        """Call the operator fun and return the output. Catch the exception if catch_execution_error is True."""
-        oldtracer = sys.gettrace()
-        if (
-            self.overwrite_python_recursion and self.parameter is None
-        ):  # Overwrite the python recursion behavior
-            # Running a tracer would slow down the execution, so we only do this when necessary.
-            sys.settrace(self._get_tracer())
+    @contextlib.contextmanager
+    def _recursion_override(self):
+        """Make recursive calls of the wrapped function bypass the FunModule.
 
-        if self.catch_execution_error:
+        Depending on how the function resolves its own name, the override
+        rebinds the module global (the common case), rebinds the closure
+        cell, or, for a locally shadowed name, falls back to a sys.settrace
+        tracer. The first two have no per-instruction cost; only the tracer
+        path pays the interpreter's tracing tax.
+        """
+        if not (
+            self.overwrite_python_recursion
+            and self.parameter is None
+            and self._can_recurse
+        ):
+            yield
+            return
+        scope = self._recursion_scope
+        if scope == "global":
+            # The function refers to itself through its module globals.
+            # Temporarily rebind the name to the undecorated function so
+            # recursive calls bypass the FunModule wrapper.
+            gdict = self._fun.__globals__
+            gname = self._fun.__name__
+            prev = gdict.get(gname, _MISSING)
+            gdict[gname] = self._fun
             try:
-                output = fun(*_args, **_kwargs)
-            except Exception as e:
-                output = self._construct_error_comment(e)
+                yield
+            finally:
+                if prev is _MISSING:
+                    gdict.pop(gname, None)
+                else:
+                    gdict[gname] = prev
+        elif scope == "closure":
+            # The recursive name is captured in a closure cell, which we can
+            # rebind directly; no tracer and no ctypes frame sync.
+            cell = self._fun.__closure__[self._closure_index]
+            prev = cell.cell_contents
+            cell.cell_contents = self._fun
+            try:
+                yield
+            finally:
+                cell.cell_contents = prev
         else:
-            output = fun(*_args, **_kwargs)
+            # The name is shadowed in locals; this can only be intercepted
+            # with a tracer.
+            oldtracer = sys.gettrace()
+            sys.settrace(self._get_tracer())
+            try:
+                yield
+            finally:
+                sys.settrace(oldtracer)
 
-        sys.settrace(oldtracer)
+    def sync_call_fun(self, fun, *_args, **_kwargs):
+        """Call the operator fun and return the output. Catch the exception if catch_execution_error is True."""
+        with self._recursion_override():
+            if self.catch_execution_error:
+                try:
+                    output = fun(*_args, **_kwargs)
+                except Exception as e:
+                    output = self._construct_error_comment(e)
+            else:
+                output = fun(*_args, **_kwargs)
         return output
 
     async def async_call_fun(self, fun, *_args, **_kwargs):
-        oldtracer = sys.gettrace()
-        if (
-            self.overwrite_python_recursion and self.parameter is None
-        ):  # Overwrite the python recursion behavior
-            # Running a tracer would slow down the execution, so we only do this when necessary.
-            sys.settrace(self._get_tracer())
-
-        if self.catch_execution_error:
-            try:
+        with self._recursion_override():
+            if self.catch_execution_error:
+                try:
+                    output = await fun(*_args, **_kwargs)
+                except Exception as e:
+                    output = self._construct_error_comment(e)
+            else:
                 output = await fun(*_args, **_kwargs)
-            except Exception as e:
-                output = self._construct_error_comment(e)
-        else:
-            output = await fun(*_args, **_kwargs)
-
-        sys.settrace(oldtracer)
         return output
 
     def preprocess_inputs(self, args, kwargs, _args, _kwargs):
@@ -462,16 +691,26 @@ class FunModule(Module):
         """
         # Construct the inputs to call self.fun
         if self._process_inputs:  # This is for handling hierarchical graph
+            # When there is no Node anywhere in the inputs, there is nothing
+            # to convert, so we skip the recursive copy altogether.
             if self.traceable_code:
-                _args, _kwargs = detach_inputs(args), detach_inputs(kwargs)
+                _args = detach_inputs(args) if _contains_node(args) else args
+                _kwargs = detach_inputs(kwargs) if _contains_node(kwargs) else kwargs
             else:  # NOTE Extract data from the nodes and pass them to the function; This line must be put inside the used_nodes context manager.
-                _args, _kwargs = to_data(args), to_data(
-                    kwargs
-                )  # read node.data; this ensures the inputs are treated as used nodes
+                # read node.data; this ensures the inputs are treated as used nodes
+                _args = to_data(args) if _contains_node(args) else args
+                _kwargs = to_data(kwargs) if _contains_node(kwargs) else kwargs
         # else the inputs are passed directly to the function
         # so we don't change _args and _kwargs
         return _args, _kwargs  # this will be passed as the input to the function
 
+    def _log_call(self, output, _args, _kwargs, external_dependencies):
+        """Record the inputs, output, and external dependencies of a call in self.info."""
+        self.info["output"] = output
+        self.info["inputs"]["args"] = _args
+        self.info["inputs"]["kwargs"] = _kwargs
+        self.info["external_dependencies"] = external_dependencies
+
     def postprocess_output(self, output, fun, _args, _kwargs, used_nodes, inputs):
         """
             Wrap the output as a MessageNode. Log the inputs and output of the function call.
@@ -485,16 +724,15 @@ class FunModule(Module):
             inputs (Dict[str, Node]): the inputs of the operator fun.
         """
 
-        # Log inputs and output of the function call
-        self.info["output"] = output
-        self.info["inputs"]["args"] = _args
-        self.info["inputs"]["kwargs"] = _kwargs
-
         # Nodes used to create the output but not in the inputs are external dependencies.
+        # contain checks identity, so an id-keyed set gives the same result
+        # with O(1) membership tests instead of a scan over inputs per node.
+        input_ids = {id(n) for n in inputs.values()}
         external_dependencies = [
-            node for node in used_nodes if not contain(inputs.values(), node)
+            node for node in used_nodes if id(node) not in input_ids
         ]
-        self.info["external_dependencies"] = external_dependencies
+        # Log inputs and output of the function call
+        self._log_call(output, _args, _kwargs, external_dependencies)
 
         # Make sure all nodes in used_nodes are in the parents of the returned node.
         if len(external_dependencies) > 0 and not self.allow_external_dependencies:
@@ -513,7 +751,9 @@ class FunModule(Module):
     def forward(self, *args, **kwargs):
         fun = self.fun  # Define the function (only once)
         self.info["fun"] = fun
-        if inspect.iscoroutinefunction(fun):
+        # The decorated function's coroutine-ness is decided at decoration
+        # time; only run-time trainable code needs to be re-inspected.
+        if self._is_async if fun is self._fun else inspect.iscoroutinefunction(fun):
             return self.async_forward(
                 fun, *args, **kwargs
             )  # Return a coroutine that returns a MessageNode
@@ -527,6 +767,15 @@ class FunModule(Module):
         the output is not a Node, we wrap it as a MessageNode, whose inputs
         are nodes in used_nodes. Sync version.
         """
+        if not GRAPH.TRACE:
+            # When tracing is off, the inputs dict is discarded and no used
+            # node is recorded, so skip input wrapping and node tracking
+            # altogether; just unwrap the inputs, call the function, and wrap
+            # the output without the dependency bookkeeping.
+            _args, _kwargs = self.preprocess_inputs(args, kwargs, args, kwargs)
+            output = self.sync_call_fun(fun, *_args, **_kwargs)
+            self._log_call(output, _args, _kwargs, [])
+            return self.wrap(output, {}, [])
         # Wrap the inputs as nodes
         inputs, args, kwargs, _args, _kwargs = self._wrap_inputs(fun, args, kwargs)
         # Execute fun
@@ -545,6 +794,12 @@ class FunModule(Module):
         the output is not a Node, we wrap it as a MessageNode, whose inputs
         are nodes in used_nodes. Async version.
         """
+        if not GRAPH.TRACE:
+            # See sync_forward for the rationale of this fast path.
+            _args, _kwargs = self.preprocess_inputs(args, kwargs, args, kwargs)
+            output = await self.async_call_fun(fun, *_args, **_kwargs)
+            self._log_call(output, _args, _kwargs, [])
+            return self.wrap(output, {}, [])
         # Wrap the inputs as nodes
         inputs, args, kwargs, _args, _kwargs = self._wrap_inputs(fun, args, kwargs)
         # Execute fun
@@ -567,14 +822,11 @@ class FunModule(Module):
         """Wrap the output as a MessageNode of inputs as the parents."""
         # Some nodes are used in the operator fun, we need to wrap the output as a MessageNode.
         if self.parameter is not None:
-            # This is a trainiable op. Create a new op eval.
+            # This is a trainiable op, wrapped as an eval operator. Add the
+            # code parameter as one of its inputs.
             inputs.update({"__code": self.parameter})
-            description = "[eval] This operator eval(__code, *args, **kwargs) evaluates the code block, where __code is the code (str) and *args and **kwargs are the arguments of the function. The output is the result of the evaluation, i.e., __code(*args, **kwargs)."
-            name = "eval"
-            self.info["fun_name"] = "eval"
-        else:
-            description = self.description
-            name = self.name
+        description = self._wrap_description
+        name = self._wrap_name
         info = self.info.copy()
         if isinstance(output, Exception):
             e_node = ExceptionNode(
@@ -619,6 +871,26 @@ class FunModule(Module):
     def detach(self):
         return copy.deepcopy(self)
 
+    def __deepcopy__(self, memo):
+        """Deep copy, excluding the run-time caches of the trainable path.
+
+        The merged exec globals hold module objects, which cannot be
+        deep-copied, and the cached exec'd function closes over them; both
+        are rebuilt on the next call of the copy.
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        for k, v in self.__dict__.items():
+            if k == "_exec_globals":
+                v = None
+            elif k == "_fun_cache":
+                v = (None, None)
+            else:
+                v = copy.deepcopy(v, memo)
+            result.__dict__[k] = v
+        return result
+
     def generate_comment(
         self,
         code: str,
@@ -626,16 +898,14 @@ class FunModule(Module):
         comment_line_number: int,
         base_line_number: int = 0,
     ):
-        commented_code = []
-        for i, l in enumerate(code.split("\n")):
-            if i == comment_line_number - base_line_number:
-                commented_code.append(f"{l} <--- {comment}")
-            else:
-                commented_code.append(f"{l}")
-        commented_code = "\n".join(commented_code)
-        return commented_code
+        lines = code.splitlines()
+        i = comment_line_number - base_line_number
+        if 0 <= i < len(lines):
+            lines[i] = f"{lines[i]} <--- {comment}"
+        return "\n".join(lines)
 
-    def get_source(self, obj: Any, bug_mode=False):
+    @staticmethod
+    def get_source(obj: Any, bug_mode=False):
         """Get the source code of the function and its line number, excluding the @bundle decorator line.
         bug_mode=True means
         We are in the forward() function, but there is an error during execution.
@@ -654,6 +924,21 @@ class FunModule(Module):
             or inline usage
         >>>    bundle()(fun)  # or ....bundle()(fun)
         """
+        # The extraction below is deterministic per code object, so memoize it
+        # (keyed on filename and first line, which identify the source text).
+        code = None
+        if inspect.isframe(obj):
+            code = obj.f_code
+        elif inspect.ismethod(obj):
+            code = obj.__func__.__code__
+        elif inspect.isfunction(obj):
+            code = obj.__code__
+        if code is not None:
+            key = (code.co_filename, code.co_firstlineno)
+            cached = _SOURCE_CACHE.get(key)
+            if cached is not None:
+                return cached
+
         source = inspect.getsource(
             obj
         )  # the source includes @bundle, or @trace.bundle, etc. we will remove those parts.
@@ -672,12 +957,7 @@ class FunModule(Module):
                 # @bundle\   i.e., change line
                 # @......bundle(
                 # @......bundle\
-                if (
-                    ("@bundle(" in line)
-                    or ("@bundle\\" in line)
-                    or (re.search(r"@.*\.bundle\(.*", line) is not None)
-                    or (re.search(r"@.*\.bundle\\.*", line) is not None)
-                ):
+                if _BUNDLE_DECORATOR_RE.search(line) is not None:
                     decorator_usage = True
                     break  # i is the where the bundle decorator is used
 
@@ -688,9 +968,9 @@ class FunModule(Module):
             inner_source = "\n".join(lines[i:])  # i is where @bundle is used
             assert "def " in inner_source
             # str after the first bundle
-            after_bundle = "bundle".join(
-                inner_source.split("bundle")[1:]
-            )  # NOTE there may be multiple usages of bundle in the comments
+            after_bundle = inner_source.partition("bundle")[
+                2
+            ]  # NOTE there may be multiple usages of bundle in the comments
 
             # Find where the scope of brackets
             count = 0
@@ -703,10 +983,9 @@ class FunModule(Module):
                     break
             # Get the decorated source code
             after_bundle_call = after_bundle[i + 1:]  # after bundle(....)
-            extracted_source = "\n".join(
-                after_bundle_call.split("\n")[1:]
-            )  # remove the first \n
-            extracted_source = extracted_source.strip()
+            extracted_source = after_bundle_call.partition("\n")[
+                2
+            ].strip()  # remove the first line
             # Get the line number of the decorated source code
             within_bundle_call = after_bundle[: i + 1]
             n_line_changes = (
@@ -724,28 +1003,65 @@ class FunModule(Module):
                 "def" in extracted_source
             ), f"def is not in the source code: {extracted_source}"
 
+        if code is not None:
+            _SOURCE_CACHE[key] = (extracted_source, line_number)
         return extracted_source, line_number
 
 
+def _contains_node(obj):
+    """Check whether obj is a Node or a container with a Node inside.
+
+    This is a cheap pre-scan used to skip the recursive copy in to_data /
+    detach_inputs when there is nothing to convert.
+    """
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, Node):
+            return True
+        if isinstance(x, (list, tuple, set)):
+            stack.extend(x)
+        elif isinstance(x, dict):
+            stack.extend(x.values())
+        elif isinstance(x, NodeContainer):
+            stack.extend(x.__dict__.values())
+    return False
+
+
+# The conversion walkers are built once; creating them per call would
+# allocate two lambdas and a closure on every forward.
+_TO_DATA = recursive_conversion(lambda x: x.data, lambda x: x)
+_WRAP_NODE = recursive_conversion(lambda x: x, lambda x: node(x))
+_DETACH_INPUTS = recursive_conversion(lambda x: x.detach(), lambda x: x)
+
+
 def to_data(obj):
     """Extract the data from a node or a container of nodes."""
-    return recursive_conversion(lambda x: x.data, lambda x: x)(obj)
+    return _TO_DATA(obj)
 
 
 def wrap_node(obj):
     """Wrap a node on top of the original object"""
-    return recursive_conversion(lambda x: x, lambda x: node(x))(obj)
+    return _WRAP_NODE(obj)
 
 
 def detach_inputs(obj):
     """Detach a node or a container of nodes."""
-    return recursive_conversion(lambda x: x.detach(), lambda x: x)(obj)
+    return _DETACH_INPUTS(obj)
+
+
+# Resolve the C-API symbol once; going through ctypes.pythonapi.__getattr__
+# on every call repeats the symbol lookup. Declaring the argtypes also lets
+# ctypes skip the per-call py_object/c_int wrapping below.
+_PyFrame_LocalsToFast = ctypes.pythonapi.PyFrame_LocalsToFast
+_PyFrame_LocalsToFast.argtypes = [ctypes.py_object, ctypes.c_int]
+_PyFrame_LocalsToFast.restype = None
 
 
 def update_local(frame, name, value):
     """Update the value of a local variable in a frame."""
     frame.f_locals[name] = value
-    ctypes.pythonapi.PyFrame_LocalsToFast(ctypes.py_object(frame), ctypes.c_int(0))
+    _PyFrame_LocalsToFast(frame, 0)
 
 
 if __name__ == "__main__":
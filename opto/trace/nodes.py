@@ -166,7 +166,9 @@ GRAPH = Graph()  # This is a global registry of all the nodes.
 
 USED_NODES = (
     list()
-)  # A stack of sets. This is a global registry to track which nodes are read.
+)  # A stack of lists. This is a global registry to track which nodes are read.
+
+_USED_NODES_DEDUPE_SIZE = 4096  # dedupe a read list in place beyond this size
 
 T = TypeVar("T")
 
@@ -244,7 +246,19 @@ class AbstractNode(Generic[T]):
             If this attribute is not present, an AttributeError will be raised.
         """
         if len(USED_NODES) > 0 and GRAPH.TRACE:  # We're within trace_nodes context.
-            USED_NODES[-1].add(self)
+            # Appending to a list avoids hashing the node on every read;
+            # trace_nodes dedupes by identity on exit. Guard against reads
+            # in a tight loop, which would otherwise grow the list with one
+            # entry per read: dedupe in place whenever the size reaches a
+            # power of two past the threshold, which keeps memory
+            # O(distinct nodes) at amortized O(1) cost per read.
+            nodes = USED_NODES[-1]
+            nodes.append(self)
+            n = len(nodes)
+            if n >= _USED_NODES_DEDUPE_SIZE and (n & (n - 1)) == 0:
+                unique = {id(m): m for m in nodes}
+                if len(unique) != n:
+                    nodes[:] = unique.values()
         return self.__getattribute__("_data")
 
     @property
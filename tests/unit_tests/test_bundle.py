@@ -425,4 +425,92 @@ def run(trainable=False):
 print("Running tests with trainable=False")
 run(trainable=False)
 print("Running tests with trainable=True")
-run(trainable=True)
\ No newline at end of file
+run(trainable=True)
+
+# Test recursion where the decorated function resolves its own name through
+# the module globals (i.e., it's defined at the top level).
+@trace.bundle(overwrite_python_recursion=True)
+def global_recursion(n):
+    if n == 0:
+        return 0
+    val = global_recursion(n - 1)
+    assert not isinstance(val, Node)  # recursive calls run the original function
+    return n + val
+
+
+def test_global_scope_recursion():
+    from opto.trace.bundle import FunModule
+    output = global_recursion(10)
+    assert output == 55, "Failed to compute recursion"
+    # The global name is rebound back to the wrapper after the call...
+    assert isinstance(globals()["global_recursion"], FunModule)
+    # ...so a second call still traces.
+    output = global_recursion(3)
+    assert output == 6
+    assert len(output.parents) == 1
+
+
+def test_closure_scope_recursion():
+    from opto.trace.bundle import FunModule
+
+    # Here the decorated function resolves its own name through a closure cell.
+    @trace.bundle(overwrite_python_recursion=True)
+    def closure_recursion(n):
+        if n == 0:
+            return 0
+        val = closure_recursion(n - 1)
+        assert not isinstance(val, Node)  # recursive calls run the original function
+        return n + val
+
+    output = closure_recursion(10)
+    assert output == 55, "Failed to compute recursion"
+    # The closure cell is restored to the wrapper after the call...
+    assert isinstance(closure_recursion, FunModule)
+    # ...so a second call still traces.
+    output = closure_recursion(3)
+    assert output == 6
+    assert len(output.parents) == 1
+
+
+def test_bundle_stop_tracing():
+    from opto.trace import bundle
+
+    @bundle()
+    def add(a, b):
+        return a + b
+
+    x = node(1)
+    y = node(2)
+    with trace.stop_tracing():
+        z = add(x, y)
+    assert z == 3
+    assert z.inputs == {}
+    assert len(z.parents) == 0
+    # Tracing resumes once the context exits.
+    z = add(x, y)
+    assert z == 3
+    assert len(z.parents) == 2
+
+
+test_global_scope_recursion()
+test_closure_scope_recursion()
+test_bundle_stop_tracing()
+
+
+def test_info_snapshot_keys():
+    from opto.trace import bundle
+
+    # Default (auto-generated) description; the info snapshot of the output
+    # must still carry the full schema, including the lazy entries.
+    @bundle()
+    def add(a, b):
+        """Add two numbers."""
+        return a + b
+
+    out = add(node(1), node(2))
+    assert "doc" in out.info and "signature" in out.info
+    assert out.info["doc"] == "Add two numbers."
+    assert list(out.info["signature"].parameters) == ["a", "b"]
+
+
+test_info_snapshot_keys()
@@ -39,4 +39,21 @@ def test_node_over_container_over_container_over_node():
 test_node_over_container_over_container_over_node()
 simple_test_unnested()
 simple_test_node_over_container()
-simple_test_container_over_node()
\ No newline at end of file
+simple_test_container_over_node()
+
+def test_deeply_nested_container():
+    # Nesting beyond the interpreter's recursion limit; the iterative walker
+    # handles this where a recursive traversal would raise RecursionError.
+    import sys
+
+    depth = 2 * sys.getrecursionlimit()
+    nested = node(0)
+    for _ in range(depth):
+        nested = [nested]
+    out = to_data(nested)
+    for _ in range(depth):
+        out = out[0]
+    assert out == 0
+
+
+test_deeply_nested_container()